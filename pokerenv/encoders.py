@@ -0,0 +1,188 @@
+import numpy as np
+import gym
+import math
+from treys import Card, Deck
+
+# Per-card lookup tables, keyed by the treys card integer
+FULL_DECK = Deck.GetFullDeck()
+CARD_INDEX = {card: i for i, card in enumerate(FULL_DECK)}
+CARD_SUIT = {card: Card.get_suit_int(card) for card in FULL_DECK}
+CARD_RANK = {card: Card.get_rank_int(card) for card in FULL_DECK}
+N_CARDS = len(FULL_DECK)
+
+RAW_SIZE = 58
+N_OTHERS = 5
+OTHER_FIELDS = 6
+# Layout shared by the one-hot and compact encoders, see obs_indices.py for the named entries
+HOLE_CARDS_START = 8
+BOARD_CARDS_START = HOLE_CARDS_START + N_CARDS
+PLAYER_START = BOARD_CARDS_START + N_CARDS
+TABLE_START = PLAYER_START + 3
+OTHERS_START = TABLE_START + 4
+PLANES_SIZE = OTHERS_START + N_OTHERS * OTHER_FIELDS
+
+
+class ObservationEncoder:
+    size = RAW_SIZE
+    dtype = np.float32
+
+    def observation_space(self):
+        return gym.spaces.Box(-math.inf, math.inf, (self.size, 1))
+
+    def empty(self, n=None):
+        if n is None:
+            return np.zeros(self.size, dtype=self.dtype)
+        return np.zeros((n, self.size), dtype=self.dtype)
+
+    def encode(self, table, player, out=None):
+        if out is None:
+            out = self.empty()
+        else:
+            out[:] = 0
+        self._write(table, player, table._get_valid_actions(player), out)
+        return out
+
+    def encode_batch(self, tables, out=None):
+        # Encodes the next acting player of each table, tables whose hand is over get an all zero row
+        if out is None:
+            out = self.empty(len(tables))
+        else:
+            out[:] = 0
+        for i, table in enumerate(tables):
+            if not table.hand_is_over:
+                player = table.players[table.next_player_i]
+                self._write(table, player, table._get_valid_actions(player), out[i])
+        return out
+
+    def _write(self, table, player, valid_actions, out):
+        raise NotImplementedError
+
+
+class RawEncoder(ObservationEncoder):
+    # The original 58 entry layout, with cards as treys suit and rank integers
+    def _write(self, table, player, valid_actions, out):
+        out[0] = player.identifier
+        for action in valid_actions['actions_list']:
+            out[action.value+1] = 1
+        out[5] = valid_actions['bet_range'][0]
+        out[6] = valid_actions['bet_range'][1]
+
+        out[7] = player.position
+        out[8] = CARD_SUIT[player.cards[0]]
+        out[9] = CARD_RANK[player.cards[0]]
+        out[10] = CARD_SUIT[player.cards[1]]
+        out[11] = CARD_RANK[player.cards[1]]
+        out[12] = player.stack
+        out[13] = player.money_in_pot
+        out[14] = player.bet_this_street
+
+        out[15] = table.street
+        for i, card in enumerate(table.cards):
+            out[16 + (i * 2)] = CARD_SUIT[card]
+            out[17 + (i * 2)] = CARD_RANK[card]
+        out[20] = table.pot
+        out[21] = table.bet_to_match
+        out[22] = table.minimum_raise
+
+        i = 0
+        for other in table.players:
+            if other is player:
+                continue
+            out[23 + i * 6] = other.position
+            out[24 + i * 6] = other.state.value
+            out[25 + i * 6] = other.stack
+            out[26 + i * 6] = other.money_in_pot
+            out[27 + i * 6] = other.bet_this_street
+            out[28 + i * 6] = int(other.all_in)
+            i += 1
+
+
+class OneHotEncoder(ObservationEncoder):
+    # Hole and board cards as 52 entry masks (card index = rank * 4 + suit), other entries as in RawEncoder
+    size = PLANES_SIZE
+
+    def _chips(self, table, value, pot=False):
+        return value
+
+    def _write(self, table, player, valid_actions, out):
+        out[0] = player.identifier
+        for action in valid_actions['actions_list']:
+            out[action.value+1] = 1
+        out[5] = self._chips(table, valid_actions['bet_range'][0])
+        out[6] = self._chips(table, valid_actions['bet_range'][1])
+        out[7] = player.position
+
+        for card in player.cards:
+            out[HOLE_CARDS_START + CARD_INDEX[card]] = 1
+        for card in table.cards:
+            out[BOARD_CARDS_START + CARD_INDEX[card]] = 1
+
+        out[PLAYER_START] = self._chips(table, player.stack)
+        out[PLAYER_START + 1] = self._chips(table, player.money_in_pot, pot=True)
+        out[PLAYER_START + 2] = self._chips(table, player.bet_this_street)
+
+        out[TABLE_START] = table.street
+        out[TABLE_START + 1] = self._chips(table, table.pot, pot=True)
+        out[TABLE_START + 2] = self._chips(table, table.bet_to_match)
+        out[TABLE_START + 3] = self._chips(table, table.minimum_raise)
+
+        offset = OTHERS_START
+        for other in table.players:
+            if other is player:
+                continue
+            out[offset] = other.position
+            out[offset + 1] = other.state.value
+            out[offset + 2] = self._chips(table, other.stack)
+            out[offset + 3] = self._chips(table, other.money_in_pot, pot=True)
+            out[offset + 4] = self._chips(table, other.bet_this_street)
+            out[offset + 5] = int(other.all_in)
+            offset += OTHER_FIELDS
+
+
+class CompactEncoder(OneHotEncoder):
+    # The one-hot layout, with chip amounts divided by chip_scale (defaults to the tables stack_high) and clipped to [0, 1].
+    # Pot amounts (pot, money in pot) are divided by n_players * chip_scale instead, so big pots do not saturate.
+    # With dtype=np.uint8 the normalized chip amounts are quantized to 0-255, the remaining entries are small integers.
+    def __init__(self, dtype=np.float16, chip_scale=None):
+        self.dtype = np.dtype(dtype)
+        if self.dtype != np.float16 and self.dtype != np.uint8:
+            raise ValueError("CompactEncoder dtype must be np.float16 or np.uint8")
+        self.chip_scale = chip_scale
+        self.quantize = 255 if self.dtype == np.uint8 else 1
+
+    def observation_space(self):
+        # Chip amounts are bounded by quantize, identifiers and positions by 5, the street by 3 and flags by 1
+        high = np.ones((self.size, 1))
+        high[[0, 7]] = 5
+        high[PLAYER_START:PLAYER_START + 3] = self.quantize
+        high[TABLE_START] = 3
+        high[TABLE_START + 1:TABLE_START + 4] = self.quantize
+        high[[5, 6]] = self.quantize
+        for offset in range(OTHERS_START, PLANES_SIZE, OTHER_FIELDS):
+            high[offset] = 5
+            high[offset + 2:offset + 5] = self.quantize
+        return gym.spaces.Box(np.zeros((self.size, 1)), high, dtype=self.dtype)
+
+    def _chips(self, table, value, pot=False):
+        scale = table.stack_high if self.chip_scale is None else self.chip_scale
+        if pot:
+            scale *= table.n_players
+        value = min(max(value / scale, 0), 1) * self.quantize
+        return round(value) if self.dtype == np.uint8 else value
+
+
+encoders = {
+    'raw': RawEncoder,
+    'one_hot': OneHotEncoder,
+    'compact': CompactEncoder,
+}
+
+
+def get_encoder(encoder):
+    if encoder is None:
+        return RawEncoder()
+    if isinstance(encoder, str):
+        if encoder not in encoders:
+            raise ValueError("Unknown observation encoder '%s', expected one of %s" % (encoder, list(encoders.keys())))
+        return encoders[encoder]()
+    return encoder
@@ -0,0 +1,140 @@
+import os
+import math
+import numpy as np
+from collections import deque
+from itertools import permutations
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+from pokerenv.table import Table
+import pokerenv.obs_indices as indices
+
+
+class RunningStats:
+    # Running per-agent mean and variance (Welford / Chan et al. batch merge)
+    def __init__(self, n_agents):
+        self.n = 0
+        self.mean = np.zeros(n_agents)
+        self.m2 = np.zeros(n_agents)
+
+    def update(self, samples):
+        samples = np.asarray(samples, dtype=np.float64)
+        n_new = samples.shape[0]
+        if n_new == 0:
+            return
+        mean_new = samples.mean(axis=0)
+        m2_new = ((samples - mean_new) ** 2).sum(axis=0)
+        n_total = self.n + n_new
+        delta = mean_new - self.mean
+        self.mean = self.mean + delta * n_new / n_total
+        self.m2 = self.m2 + m2_new + delta ** 2 * self.n * n_new / n_total
+        self.n = n_total
+
+    def variance(self):
+        if self.n < 2:
+            return np.full(self.mean.shape, np.inf)
+        return self.m2 / (self.n - 1)
+
+    def half_width(self, confidence):
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * np.sqrt(self.variance() / max(self.n, 1))
+
+
+def play_hand(table, agents):
+    # Plays a single hand where agents[i] acts for the player with identifier i, returns the summed rewards
+    obs = table.reset()
+    for agent in agents:
+        if hasattr(agent, 'reset'):
+            agent.reset()
+    total = np.zeros(len(agents))
+    while True:
+        acting_player = int(obs[indices.ACTING_PLAYER])
+        obs, rewards, done, _ = table.step(agents[acting_player].get_action(obs))
+        for i, reward in enumerate(rewards):
+            if reward is not None:
+                total[i] += reward
+        if done:
+            return total
+
+
+def play_duplicate_deals(table, agents, seeds):
+    # For each deal seed, replays the same deal once per seat permutation of the agents.
+    # Returns the per-hand result of each agent averaged over the permutations, in mbb/hand.
+    n_agents = len(agents)
+    seat_permutations = list(permutations(range(n_agents)))
+    results = np.zeros((len(seeds), n_agents))
+    for d, seed in enumerate(seeds):
+        for seats in seat_permutations:
+            # seats[a] is the identifier (and thus stack, cards and position) which agent a plays this hand
+            seated_agents = [None] * n_agents
+            for agent_i, identifier in enumerate(seats):
+                seated_agents[identifier] = agents[agent_i]
+            table.seed(seed)
+            rewards = play_hand(table, seated_agents)
+            results[d] += rewards[list(seats)]
+    return results * 1000 / len(seat_permutations)
+
+
+_worker_table = None
+_worker_agents = None
+
+
+def _initialize_worker(agents, table_kwargs):
+    global _worker_table, _worker_agents
+    _worker_agents = agents
+    _worker_table = Table(len(agents), **table_kwargs)
+
+
+def _play_chunk(seeds):
+    return play_duplicate_deals(_worker_table, _worker_agents, seeds)
+
+
+def evaluate(agents, precision=10, confidence=0.95, max_deals=100000, min_deals=100, chunk_size=10, n_workers=None,
+             seed=0, **table_kwargs):
+    # agents[i] needs a get_action(observation) method (reset() is called before each hand if present), and must be
+    # picklable when n_workers > 1. Stops once every agents confidence interval half width is at most precision
+    # mbb/hand (after min_deals), or after max_deals. Extra keyword arguments are passed to Table.
+    n_agents = len(agents)
+    if n_agents < 2 or n_agents > 6:
+        raise ValueError("evaluate needs between 2 and 6 agents, one per seat")
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    # Deal d is seeded with [seed, d], so the same deals are replayed no matter how the work is sharded
+    chunks = ([[seed, d] for d in range(start, min(start + chunk_size, max_deals))]
+              for start in range(0, max_deals, chunk_size))
+    stats = RunningStats(n_agents)
+
+    def finished():
+        return stats.n >= min_deals and np.all(stats.half_width(confidence) <= precision)
+
+    if n_workers <= 1:
+        table = Table(n_agents, **table_kwargs)
+        for chunk in chunks:
+            stats.update(play_duplicate_deals(table, agents, chunk))
+            if finished():
+                break
+    else:
+        with ProcessPoolExecutor(n_workers, initializer=_initialize_worker, initargs=(agents, table_kwargs)) as pool:
+            # Keep a bounded amount of chunks in flight, so little work is wasted when stopping early. Results are
+            # merged in submission order, so the deals counted (and the results) only depend on seed and chunk_size.
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_play_chunk, chunk))
+                if len(pending) < n_workers * 2:
+                    continue
+                stats.update(pending.popleft().result())
+                if finished():
+                    break
+            else:
+                while pending and not finished():
+                    stats.update(pending.popleft().result())
+            for future in pending:
+                future.cancel()
+
+    n_hands = stats.n * math.factorial(n_agents)
+    return {
+        'mean': stats.mean,
+        'confidence_interval': stats.half_width(confidence),
+        'std': np.sqrt(stats.variance()),
+        'n_deals': stats.n,
+        'n_hands': n_hands,
+    }
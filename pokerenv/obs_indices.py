@@ -4,4 +4,10 @@ VALID_BET_LOW = 5
 VALID_BET_HIGH = 6
 ACTING_PLAYER_POSITION = 7
 ACTING_PLAYER_STACK_SIZE = 12
-POT_SIZE = 20
\ No newline at end of file
+POT_SIZE = 20
+
+# Layout of the 'one_hot' and 'compact' observation encoders, entries 0-7 are shared with the layout above
+HOLE_CARDS = [*range(8, 60)]
+BOARD_CARDS = [*range(60, 112)]
+PLANES_ACTING_PLAYER_STACK_SIZE = 112
+PLANES_POT_SIZE = 116
@@ -27,8 +27,9 @@ class Player:
     def __gt__(self, other):
         return self.identifier > other.identifier
 
-    def get_reward(self):
-        if self.has_acted:
+    def get_reward(self, hand_is_over=False):
+        # Players who have not acted yet only receive their reward once the hand is over
+        if self.has_acted or hand_is_over:
             tmp = self.pending_penalty
             self.pending_penalty = 0
             return tmp + self.winnings
@@ -5,7 +5,8 @@ import math
 from treys import Deck, Evaluator, Card
 from pokerenv.common import GameState, PlayerState, PlayerAction, TablePosition, Action
 from pokerenv.player import Player
-from pokerenv.utils import pretty_print_hand, approx_gt, approx_lte
+from pokerenv.encoders import get_encoder
+from pokerenv.utils import describe_hand, approx_gt, approx_lte
 
 # Just some values to make hand history work properly
 SB = 2.5
@@ -13,9 +14,11 @@ BB = 5
 
 
 class Table(gym.Env):
-    def __init__(self, n_players, player_names=None, track_single_player=False, stack_low=50, stack_high=200, hand_history_location='hands/', invalid_action_penalty=0):
+    def __init__(self, n_players, player_names=None, track_single_player=False, stack_low=50, stack_high=200, hand_history_location='hands/', invalid_action_penalty=0, observation_encoder=None):
         self.action_space = gym.spaces.Tuple((gym.spaces.Discrete(4), gym.spaces.Box(-math.inf, math.inf, (1, 1))))
-        self.observation_space = gym.spaces.Box(-math.inf, math.inf, (58, 1))
+        # Either an ObservationEncoder instance, or one of 'raw' (default), 'one_hot', 'compact'
+        self.observation_encoder = get_encoder(observation_encoder)
+        self.observation_space = self.observation_encoder.observation_space()
         self.n_players = n_players
         if player_names is None:
             player_names = {}
@@ -90,6 +93,7 @@ class Table(gym.Env):
         return self._get_observation(self.players[self.next_player_i])
 
     def step(self, action: Action):
+        hand_was_over = self.hand_is_over
         self.current_player_i = self.next_player_i
         player = self.players[self.current_player_i]
         self.current_turn += 1
@@ -198,8 +202,13 @@ class Table(gym.Env):
         if self.street_finished and not self.hand_is_over:
             self._street_transition()
 
-        obs = np.zeros(self.observation_space.shape[0]) if self.hand_is_over else self._get_observation(self.players[self.next_player_i])
-        rewards = np.asarray([player.get_reward() for player in sorted(self.players)])
+        # Settle the pot once, on the step which ended the hand
+        if self.hand_is_over and not hand_was_over:
+            self._distribute_pot()
+            self._finish_hand()
+
+        obs = self.observation_encoder.empty() if self.hand_is_over else self._get_observation(self.players[self.next_player_i])
+        rewards = np.asarray([player.get_reward(self.hand_is_over) for player in sorted(self.players)])
         return obs, rewards, self.hand_is_over, {}
 
     def _street_transition(self, transition_to_end=False):
@@ -267,17 +276,12 @@ class Table(gym.Env):
 
     def _write_show_down(self):
         self.hand_history.append("*** SHOW DOWN ***")
-        hand_types = [self.evaluator.class_to_string(self.evaluator.get_rank_class(p.hand_rank))
-                        for p in self.players if p.state is PlayerState.ACTIVE]
         for player in self.players:
             if player.state is PlayerState.ACTIVE:
                 player.calculate_hand_rank(self.evaluator, self.cards)
-                player_hand_type = self.evaluator.class_to_string(self.evaluator.get_rank_class(player.hand_rank))
-                matches = len([m for m in hand_types if m is player_hand_type])
-                multiple = matches > 1
                 self.hand_history.append("%s: shows [%s %s] (%s)" %
                                     (player.name, Card.int_to_str(player.cards[0]), Card.int_to_str(player.cards[1]),
-                                     pretty_print_hand(player.cards, player_hand_type, self.cards, multiple))
+                                     describe_hand(player.hand_rank)['text'])
                                     )
 
     def _finish_hand(self):
@@ -304,42 +308,51 @@ class Table(gym.Env):
                                  Card.int_to_str(self.cards[2]), Card.int_to_str(self.cards[3]),
                                  Card.int_to_str(self.cards[4]))
                                 )
+        if self.hand_history_enabled and len([p for p in self.players if p.state is PlayerState.ACTIVE]) > 1:
+            for i, player in enumerate(self.players):
+                if player.state is PlayerState.ACTIVE:
+                    if player.winnings_for_hh > 0:
+                        self._write_event("Seat %d: %s showed [%s %s] and won ($%.2f) with %s" %
+                                          (i+1, player.name, Card.int_to_str(player.cards[0]),
+                                           Card.int_to_str(player.cards[1]), player.winnings_for_hh*BB,
+                                           describe_hand(player.hand_rank)['text'])
+                                          )
+                    else:
+                        self._write_event("Seat %d: %s showed [%s %s] and lost with %s" %
+                                          (i+1, player.name, Card.int_to_str(player.cards[0]),
+                                           Card.int_to_str(player.cards[1]), describe_hand(player.hand_rank)['text'])
+                                          )
         if self.hand_history_enabled and self.hand_history_location is not None:
             with open('%s' % self.hand_history_location + 'handhistory_%s.txt' % time.time(), 'w') as f:
                 for row in self.hand_history:
                     f.writelines(row + '\n')
 
     def _distribute_pot(self):
-        pot = 0
         for player in self.players:
-            if player.state is not PlayerState.ACTIVE:
-                pot += player.money_in_pot
-                player.winnings -= player.money_in_pot
+            player.winnings -= player.money_in_pot
         active_players = [p for p in self.players if p.state is PlayerState.ACTIVE]
         if len(active_players) == 1:
+            pot = sum([p.money_in_pot for p in self.players])
             active_players[0].winnings += pot
-            active_players[0].winnings_for_hh += pot + active_players[0].money_in_pot
+            active_players[0].winnings_for_hh += pot
             return
         for player in active_players:
             player.calculate_hand_rank(self.evaluator, self.cards)
-        while True:
-            min_money_in_pot = min([p.money_in_pot for p in active_players])
-            for player in active_players:
-                pot += min_money_in_pot
-                player.money_in_pot -= min_money_in_pot
-                player.winnings -= min_money_in_pot
-            best_hand_rank = min([p.hand_rank for p in active_players])
-            winners = [p for p in active_players if p.hand_rank == best_hand_rank]
+        # Split the money into a main pot and side pots, one for each all-in amount of the players still in the hand
+        levels = sorted(set([p.money_in_pot for p in active_players]))
+        previous_level = 0
+        for i, level in enumerate(levels):
+            if i == len(levels) - 1:
+                pot = sum([max(p.money_in_pot - previous_level, 0) for p in self.players])
+            else:
+                pot = sum([max(min(p.money_in_pot, level) - previous_level, 0) for p in self.players])
+            contenders = [p for p in active_players if p.money_in_pot >= level]
+            best_hand_rank = min([p.hand_rank for p in contenders])
+            winners = [p for p in contenders if p.hand_rank == best_hand_rank]
             for winner in winners:
                 winner.winnings += pot / len(winners)
                 winner.winnings_for_hh += pot / len(winners)
-            active_players = [p for p in active_players if p.money_in_pot > 0]
-            if len(active_players) <= 1:
-                if len(active_players) == 1:
-                    active_players[0].winnings += active_players[0].money_in_pot
-                    active_players[0].winnings_for_hh += active_players[0].money_in_pot
-                break
-            pot = 0
+            previous_level = level
 
     def _is_action_valid(self, player, action, valid_actions):
         action_list, bet_range = valid_actions['actions_list'], valid_actions['bet_range']
@@ -385,38 +398,4 @@ class Table(gym.Env):
         return {'actions_list': valid_actions, 'bet_range': valid_bet_range}
 
     def _get_observation(self, player):
-        observation = np.zeros(self.observation_space.shape[0], dtype=np.float32)
-        observation[0] = player.identifier
-
-        valid_actions = self._get_valid_actions(player)
-        for action in valid_actions['actions_list']:
-            observation[action.value+1] = 1
-        observation[5] = valid_actions['bet_range'][0]
-        observation[6] = valid_actions['bet_range'][1]
-
-        observation[7] = player.position
-        observation[8] = Card.get_suit_int(player.cards[0])
-        observation[9] = Card.get_rank_int(player.cards[0])
-        observation[10] = Card.get_suit_int(player.cards[1])
-        observation[11] = Card.get_rank_int(player.cards[1])
-        observation[12] = player.stack
-        observation[13] = player.money_in_pot
-        observation[14] = player.bet_this_street
-
-        observation[15] = self.street
-        for i in range(len(self.cards)):
-            observation[16 + (i * 2)] = Card.get_suit_int(self.cards[i])
-            observation[17 + (i * 2)] = Card.get_rank_int(self.cards[i])
-        observation[20] = self.pot
-        observation[21] = self.bet_to_match
-        observation[22] = self.minimum_raise
-
-        others = [other for other in self.players if other is not player]
-        for i in range(len(others)):
-            observation[23 + i * 6] = others[i].position
-            observation[24 + i * 6] = others[i].state.value
-            observation[25 + i * 6] = others[i].stack
-            observation[26 + i * 6] = others[i].money_in_pot
-            observation[27 + i * 6] = others[i].bet_this_street
-            observation[28 + i * 6] = int(others[i].all_in)
-        return observation
\ No newline at end of file
+        return self.observation_encoder.encode(self, player)
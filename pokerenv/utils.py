@@ -1,112 +1,81 @@
 import numpy as np
 from collections import Counter
-from treys import Card
+from treys import Card, Evaluator
 
 singulars = ['Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine', 'Ten', 'Jack', 'Queen', 'King', 'Ace']
 plurals = ['Twos', 'Threes', 'Fours', 'Fives', 'Sixes', 'Sevens', 'Eights', 'Nines', 'Tens', 'Jacks', 'Queens', 'Kings', 'Aces']
 
 
-def pretty_print_hand(hand_cards, hand_type, table_cards, kicker):
-    combined = []
-    combined.extend(hand_cards)
-    combined.extend(table_cards)
-    values = [Card.get_rank_int(c) for c in combined]
-    suits = [Card.get_suit_int(c) for c in combined]
-    suit_ints = [1, 2, 4, 8]
-    if hand_type == 'High Card':
-        return 'High card %s' % singulars[max(values)]
-    if hand_type == 'Pair':
-        doubles = []
-        for k, v in Counter(values).items():
-            doubles.extend([k] * (v // 2))
-        return 'a pair of %s' % plurals[max(doubles)]
-    if hand_type == 'Two Pair':
-        doubles = []
-        for k, v in Counter(values).items():
-            doubles.extend([k] * (v // 2))
-        first = max(doubles)
-        doubles.remove(first)
-        second = max(doubles)
-        return 'two pair, %s and %s' % (plurals[first], plurals[second])
-    if hand_type == 'Three of a Kind':
-        triples = []
-        for k, v in Counter(values).items():
-            triples.extend([k] * (v // 3))
-        return 'three of a kind, %s' % plurals[max(triples)]
-    if hand_type == 'Straight':
-        # TODO: Fix this mess
-        previous_value = None
-        high = None
-        low = None
-        sequence = 1
-        for value in reversed(sorted(set(values))):
-            if previous_value is None:
-                previous_value = value
-                high = value
-                continue
-            elif value == previous_value-1:
-                sequence += 1
-                if sequence == 4 and value == 0:
-                    if 12 in values:
-                        low = value
-                        break
-            else:
-                sequence = 1
-                high = value
-            if sequence == 5:
-                low = value
-                break
-            previous_value = value
-        return 'a straight, %s to %s' % (singulars[low], singulars[high])
-    if hand_type == 'Flush':
-        # TODO: Fix this mess
-        counts = np.array([len([suit for suit in suits if suit == i]) for i in suit_ints])
-        suit_i = int(np.argmax(counts))
-        high = max([values[i] for i in range(len(values)) if suits[i] == suit_ints[suit_i]])
-        return 'a flush, %s high' % singulars[high]
-    if hand_type == 'Full House':
-        triples = []
-        for k, v in Counter(values).items():
-            triples.extend([k] * (v // 3))
-        doubles = []
-        for k, v in Counter(values).items():
-            doubles.extend([k] * (v // 2))
-        return 'a full house, %s full of %s' % (plurals[max(triples)], plurals[max(doubles)])
-    if hand_type == 'Four of a Kind':
-        quads = []
-        for k, v in Counter(values).items():
-            quads.extend([k] * (v // 4))
-        return 'four of a kind, %s' % plurals[max(quads)]
-    if hand_type == 'Straight Flush':
-        # TODO: Fix this mess
-        counts = np.array([len([suit for suit in suits if suit == i]) for i in suit_ints])
-        suit_i = int(np.argmax(counts))
-        correct_suit = [values[i] for i in range(len(values)) if suits[i] == suit_ints[suit_i]]
+# Hand history texts by treys hand category, from the key ranks of the hand
+hand_texts = {
+    'High Card': lambda ranks: 'High card %s' % singulars[ranks[0]],
+    'Pair': lambda ranks: 'a pair of %s' % plurals[ranks[0]],
+    'Two Pair': lambda ranks: 'two pair, %s and %s' % (plurals[ranks[0]], plurals[ranks[1]]),
+    'Three of a Kind': lambda ranks: 'three of a kind, %s' % plurals[ranks[0]],
+    'Straight': lambda ranks: 'a straight, %s to %s' % (singulars[ranks[1]], singulars[ranks[0]]),
+    'Flush': lambda ranks: 'a flush, %s high' % singulars[ranks[0]],
+    'Full House': lambda ranks: 'a full house, %s full of %s' % (plurals[ranks[0]], plurals[ranks[1]]),
+    'Four of a Kind': lambda ranks: 'four of a kind, %s' % plurals[ranks[0]],
+    'Straight Flush': lambda ranks: 'royal flush, %s to %s' % (singulars[ranks[1]], singulars[ranks[0]]),
+    # Newer treys versions report the ace high straight flush as its own category
+    'Royal Flush': lambda ranks: 'royal flush, %s to %s' % (singulars[ranks[1]], singulars[ranks[0]]),
+}
+
+# Hand descriptions by treys hand rank, filled in lazily by describe_hand
+hand_descriptions = {}
+_evaluator = None
+_rank_values = None
+
+
+def _get_evaluator():
+    global _evaluator, _rank_values
+    if _evaluator is None:
+        _evaluator = Evaluator()
+        # Invert the evaluator lookup tables to get the five card values (descending) making up each hand rank
+        _rank_values = {}
+        for lookup in [_evaluator.table.flush_lookup, _evaluator.table.unsuited_lookup]:
+            for prime_product, rank in lookup.items():
+                values = []
+                for value, prime in reversed(list(enumerate(Card.PRIMES))):
+                    while prime_product % prime == 0:
+                        values.append(value)
+                        prime_product //= prime
+                _rank_values[rank] = values
+    return _evaluator
 
-        previous_value = None
-        high = None
-        low = None
-        sequence = 1
-        for value in reversed(sorted(set(correct_suit))):
-            if previous_value is None:
-                previous_value = value
-                high = value
-                continue
-            elif value == previous_value - 1:
-                sequence += 1
-                if sequence == 4 and value == 0:
-                    if 12 in correct_suit:
-                        low = value
-                        break
+
+def describe_hand(rank):
+    # Describes the hand with the given treys rank: category, key ranks and kickers (rank ints, highest first) and the
+    # hand history text. Computed once per rank and cached.
+    if rank not in hand_descriptions:
+        evaluator = _get_evaluator()
+        category = evaluator.class_to_string(evaluator.get_rank_class(rank))
+        values = _rank_values[rank]
+        counts = Counter(values)
+        # Group the values by multiplicity, so eg. a full house becomes [trips, pair], and a pair [pair, k1, k2, k3]
+        grouped = sorted(counts.keys(), key=lambda v: (counts[v], v), reverse=True)
+        if category not in hand_texts:
+            raise Exception("Unknown hand category '%s' for hand rank %d" % (category, rank))
+        if category in ['Straight', 'Straight Flush', 'Royal Flush']:
+            # The wheel (five high) is the only straight where the ace plays low
+            if values[0] == 12 and values[1] == 3:
+                ranks, kickers = [3, 0], []
             else:
-                sequence = 1
-                high = value
-            if sequence == 5:
-                low = value
-                break
-            previous_value = value
-        return 'royal flush, %s to %s' % (singulars[low], singulars[high])
-    raise Exception("Incorrect hand/table passed to pretty_print_hand")
+                ranks, kickers = [values[0], values[-1]], []
+        elif category in ['High Card', 'Flush']:
+            ranks, kickers = values[:1], values[1:]
+        elif category in ['Two Pair', 'Full House']:
+            ranks, kickers = grouped[:2], grouped[2:]
+        elif category in ['Pair', 'Three of a Kind', 'Four of a Kind']:
+            ranks, kickers = grouped[:1], grouped[1:]
+        text = hand_texts[category](ranks)
+        hand_descriptions[rank] = {'category': category, 'ranks': ranks, 'kickers': kickers, 'text': text}
+    return hand_descriptions[rank]
+
+
+def pretty_print_hand(hand_cards, hand_type, table_cards, kicker=None):
+    # hand_type and kicker are only kept for backwards compatibility, the description is derived from the hand rank
+    return describe_hand(_get_evaluator().evaluate(hand_cards, table_cards))['text']
 
 
 def approx_lte(x, y):
@@ -12,7 +12,9 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/trouverun/pokerenv",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=['tests']),
+    # Newer treys releases return a list from Deck.draw(1), and 0.1.8 adds a Royal Flush rank class
+    install_requires=['numpy', 'gym', 'treys>=0.1.3,<0.1.5'],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from treys import Card
+import pokerenv.obs_indices as indices
+from pokerenv.table import Table
+from pokerenv.common import PlayerAction, Action
+from pokerenv.encoders import RawEncoder, OneHotEncoder, CompactEncoder
+
+
+def make_table(encoder, n_players=2, seed=0):
+    table = Table(n_players, stack_low=50, stack_high=200, hand_history_location=None, observation_encoder=encoder)
+    table.seed(seed)
+    table.reset()
+    return table
+
+
+def baseline_observation(table, player):
+    # Table._get_observation before the observation encoders were added
+    observation = np.zeros(58, dtype=np.float32)
+    observation[0] = player.identifier
+    valid_actions = table._get_valid_actions(player)
+    for action in valid_actions['actions_list']:
+        observation[action.value+1] = 1
+    observation[5] = valid_actions['bet_range'][0]
+    observation[6] = valid_actions['bet_range'][1]
+    observation[7] = player.position
+    observation[8] = Card.get_suit_int(player.cards[0])
+    observation[9] = Card.get_rank_int(player.cards[0])
+    observation[10] = Card.get_suit_int(player.cards[1])
+    observation[11] = Card.get_rank_int(player.cards[1])
+    observation[12] = player.stack
+    observation[13] = player.money_in_pot
+    observation[14] = player.bet_this_street
+    observation[15] = table.street
+    for i in range(len(table.cards)):
+        observation[16 + (i * 2)] = Card.get_suit_int(table.cards[i])
+        observation[17 + (i * 2)] = Card.get_rank_int(table.cards[i])
+    observation[20] = table.pot
+    observation[21] = table.bet_to_match
+    observation[22] = table.minimum_raise
+    others = [other for other in table.players if other is not player]
+    for i in range(len(others)):
+        observation[23 + i * 6] = others[i].position
+        observation[24 + i * 6] = others[i].state.value
+        observation[25 + i * 6] = others[i].stack
+        observation[26 + i * 6] = others[i].money_in_pot
+        observation[27 + i * 6] = others[i].bet_this_street
+        observation[28 + i * 6] = int(others[i].all_in)
+    return observation
+
+
+def min_bet_or_call(obs):
+    if obs[indices.VALID_ACTIONS][PlayerAction.BET] == 1 and obs[indices.VALID_BET_LOW] < 4:
+        return Action(PlayerAction.BET, obs[indices.VALID_BET_LOW])
+    if obs[indices.VALID_ACTIONS][PlayerAction.CALL] == 1:
+        return Action(PlayerAction.CALL)
+    return Action(PlayerAction.CHECK)
+
+
+def play_seeded_hand(encoder, n_players):
+    # Plays a fixed seeded hand to the river, yields the table and each observation before acting on it
+    table = Table(n_players, hand_history_location=None, observation_encoder=encoder)
+    table.seed(3)
+    obs = table.reset()
+    done = False
+    while not done:
+        yield table, obs
+        obs, _, done, _ = table.step(min_bet_or_call(obs))
+
+
+@pytest.mark.parametrize('n_players', [2, 6])
+def test_raw_encoder_matches_baseline(n_players):
+    streets = set()
+    for table, obs in play_seeded_hand(RawEncoder(), n_players):
+        streets.add(table.street)
+        assert obs.dtype == np.float32
+        assert np.array_equal(obs, baseline_observation(table, table.players[table.next_player_i]))
+    assert len(streets) == 4
+
+
+def test_one_hot_card_masks():
+    for table, obs in play_seeded_hand(OneHotEncoder(), 3):
+        player = table.players[table.next_player_i]
+        hole, board = obs[indices.HOLE_CARDS], obs[indices.BOARD_CARDS]
+        assert hole.sum() == 2 and set(np.unique(hole)) <= {0, 1}
+        assert board.sum() == len(table.cards) and set(np.unique(board)) <= {0, 1}
+        assert obs[indices.PLANES_ACTING_PLAYER_STACK_SIZE] == np.float32(player.stack)
+        assert obs[indices.PLANES_POT_SIZE] == np.float32(table.pot)
+
+
+@pytest.mark.parametrize('encoder', [RawEncoder(), OneHotEncoder(), CompactEncoder(np.uint8)])
+def test_encode_batch_matches_encode(encoder):
+    tables = [make_table(encoder, n_players, seed) for seed, n_players in enumerate([2, 4, 6])]
+    finished = make_table(encoder, 2, 3)
+    finished.step(Action(PlayerAction.FOLD))
+    assert finished.hand_is_over
+    tables.append(finished)
+    out = encoder.empty(len(tables))
+    assert encoder.encode_batch(tables, out) is out
+    for i, table in enumerate(tables[:-1]):
+        assert np.array_equal(out[i], encoder.encode(table, table.players[table.next_player_i]))
+    assert not out[-1].any()
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.dtype('uint8'), 'uint8'])
+def test_compact_uint8_quantizes_chips(dtype):
+    encoder = CompactEncoder(dtype)
+    table = make_table(encoder)
+    player = table.players[table.next_player_i]
+    player.stack = 61.5
+    obs = encoder.encode(table, player)
+    assert obs.dtype == np.uint8
+    assert obs[indices.PLANES_ACTING_PLAYER_STACK_SIZE] == round(61.5 / 200 * 255)
+
+
+def test_compact_pot_does_not_saturate():
+    encoder = CompactEncoder(np.float16)
+    table = make_table(encoder)
+    player = table.players[table.next_player_i]
+    table.pot = 300
+    obs = encoder.encode(table, player)
+    # Pot amounts are scaled by n_players * stack_high
+    assert obs[indices.PLANES_POT_SIZE] == np.float16(300 / 400)
+
+
+def test_compact_rejects_other_dtypes():
+    with pytest.raises(ValueError):
+        CompactEncoder(np.float32)
+
+
+@pytest.mark.parametrize('dtype, chip_high', [(np.float16, 1), (np.uint8, 255)])
+def test_compact_observation_space_bounds(dtype, chip_high):
+    space = CompactEncoder(dtype).observation_space()
+    assert space.dtype == dtype
+    assert space.high[indices.PLANES_POT_SIZE, 0] == chip_high
+    assert space.high[indices.HOLE_CARDS, 0].max() == 1
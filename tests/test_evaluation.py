@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import pokerenv.obs_indices as indices
+from pokerenv.table import Table
+from pokerenv.common import PlayerAction, Action
+from pokerenv.evaluation import RunningStats, play_duplicate_deals, evaluate
+
+
+class CallAgent:
+    def get_action(self, observation):
+        if observation[indices.VALID_ACTIONS][PlayerAction.CALL] == 1:
+            return Action(PlayerAction.CALL)
+        return Action(PlayerAction.CHECK)
+
+
+class MinBetAgent:
+    def get_action(self, observation):
+        if observation[indices.VALID_ACTIONS][PlayerAction.BET] == 1:
+            return Action(PlayerAction.BET, observation[indices.VALID_BET_LOW])
+        if observation[indices.VALID_ACTIONS][PlayerAction.CALL] == 1:
+            return Action(PlayerAction.CALL)
+        return Action(PlayerAction.CHECK)
+
+
+def test_running_stats_matches_numpy():
+    samples = np.random.default_rng(0).normal(size=(103, 3))
+    stats = RunningStats(3)
+    for start in range(0, len(samples), 10):
+        stats.update(samples[start:start + 10])
+    assert stats.n == len(samples)
+    assert stats.mean == pytest.approx(np.mean(samples, axis=0))
+    assert stats.variance() == pytest.approx(np.var(samples, axis=0, ddof=1))
+
+
+@pytest.mark.parametrize('n_agents', [2, 3])
+def test_identical_agents_break_even(n_agents):
+    table = Table(n_agents, hand_history_location=None)
+    results = play_duplicate_deals(table, [CallAgent() for _ in range(n_agents)], [[0, d] for d in range(20)])
+    assert np.all(results == 0)
+
+
+@pytest.mark.parametrize('precision', [0, 20000])
+def test_results_do_not_depend_on_workers(precision):
+    # With precision 0 all deals are played, otherwise evaluation stops early
+    agents = [CallAgent(), MinBetAgent()]
+    kwargs = {'precision': precision, 'max_deals': 60, 'min_deals': 10, 'chunk_size': 5, 'seed': 1}
+    serial = evaluate(agents, n_workers=1, **kwargs)
+    parallel = evaluate(agents, n_workers=2, **kwargs)
+    assert serial['n_deals'] == parallel['n_deals']
+    assert (serial['n_deals'] == 60) == (precision == 0)
+    assert np.array_equal(serial['mean'], parallel['mean'])
+    assert serial['mean'].sum() == pytest.approx(0)
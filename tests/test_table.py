@@ -0,0 +1,72 @@
+import pytest
+from treys import Card
+from pokerenv.table import Table
+from pokerenv.common import PlayerAction, Action
+
+
+def deal(stacks, hands, board):
+    # Starts a hand where the player in position i has stacks[i] chips (blinds included) and hole cards hands[i]
+    table = Table(len(stacks), hand_history_location=None)
+    table.seed(0)
+    table.reset()
+    for player in table.players:
+        player.stack = stacks[player.position] - player.bet_this_street
+        player.cards = [Card.new(c) for c in hands[player.position]]
+    table.deck.cards = [Card.new(c) for c in board]
+    return table
+
+
+def play(table, actions):
+    # Plays (position, action) pairs in order, returns the rewards by position from the final step
+    for position, action in actions:
+        assert table.players[table.next_player_i].position == position
+        obs, rewards, done, _ = table.step(action)
+    assert done
+    return [rewards[p.identifier] for p in sorted(table.players, key=lambda p: p.position)]
+
+
+def test_heads_up_walk_rewards_player_who_did_not_act():
+    table = deal([100, 100], [['2c', '3c'], ['4d', '5d']], [])
+    rewards = play(table, [(0, Action(PlayerAction.FOLD))])
+    assert rewards == [-0.5, 0.5]
+
+
+def test_fold_out_returns_uncalled_bet():
+    table = deal([100, 100, 100], [['2c', '3c'], ['4d', '5d'], ['6h', '7h']], [])
+    rewards = play(table, [
+        (2, Action(PlayerAction.BET, 10)),
+        (0, Action(PlayerAction.FOLD)),
+        (1, Action(PlayerAction.FOLD)),
+    ])
+    assert rewards == [-0.5, -1, 1.5]
+    # 9 of the bet was uncalled (the big blind matched 1 of it) and went back to the bettors stack
+    bettor = [p for p in table.players if p.position == 2][0]
+    assert bettor.stack == pytest.approx(99)
+
+
+def test_three_way_all_in_with_side_pots_and_dead_money():
+    hands = [['Qs', 'Qh'], ['5h', '6h'], ['As', 'Ah'], ['Ks', 'Kh'], ['8c', 'Tc']]
+    table = deal([100, 100, 20, 50, 200], hands, ['2c', '7d', '9h', '4s', '3c'])
+    rewards = play(table, [
+        (2, Action(PlayerAction.BET, 20)),
+        (3, Action(PlayerAction.BET, 50)),
+        (4, Action(PlayerAction.BET, 100)),
+        (0, Action(PlayerAction.CALL)),
+        (1, Action(PlayerAction.FOLD)),
+    ])
+    # Main pot 4 * 20 + 1 (BB dead money) to AA, side pot 3 * 30 to KK, side pot 2 * 50 to QQ over T high
+    assert rewards == pytest.approx([0, -1, 61, 40, -100])
+    assert sum(rewards) == pytest.approx(0)
+
+
+def test_split_pot():
+    table = deal([100, 100, 100], [['6h', '7h'], ['4d', '5d'], ['2c', '3c']], ['As', 'Ks', 'Qs', 'Js', 'Ts'])
+    check = Action(PlayerAction.CHECK)
+    rewards = play(table, [
+        (2, Action(PlayerAction.CALL)),
+        (0, Action(PlayerAction.FOLD)),
+        (1, check), (2, check),
+        (1, check), (2, check),
+        (1, check), (2, check),
+    ])
+    assert rewards == pytest.approx([-0.5, 0.25, 0.25])
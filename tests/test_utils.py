@@ -0,0 +1,69 @@
+import pytest
+from treys import Card, Evaluator
+import pokerenv.utils as utils
+from pokerenv.utils import describe_hand, pretty_print_hand
+
+evaluator = Evaluator()
+
+# Expected texts are the output of the original (pre-memoization) pretty_print_hand for the same cards
+baseline_cases = [
+    ('Ah 2c', '3d 4s 5h 9c Kd', 'a straight, Two to Five'),
+    ('9h Tc', 'Jd Qs Kh 2c 3d', 'a straight, Nine to King'),
+    ('9s Ts', 'Js Qs Ks 2c 3d', 'royal flush, Nine to King'),
+    ('As Ks', 'Qs Js Ts 2c 3d', 'royal flush, Ten to Ace'),
+    ('5s 4s', '3s 2s As Kd Qc', 'royal flush, Two to Five'),
+    ('Kh Kd', 'Qs Qh 5c 5d 2s', 'two pair, Kings and Queens'),
+    ('Ah 3h', '7h 9h Jh 2c Kd', 'a flush, Ace high'),
+    ('7c 7d', '7h 7s Kd 2c 3c', 'four of a kind, Sevens'),
+    ('7c 7d', '7h Ks 2d 4c 9s', 'three of a kind, Sevens'),
+    ('Jc 3d', 'Jh 8s 6d 4c 2s', 'a pair of Jacks'),
+    ('Ac 3d', 'Jh 8s 6d 4c 2s', 'High card Ace'),
+]
+
+
+def rank_of(hand, board):
+    return evaluator.evaluate([Card.new(c) for c in hand.split()], [Card.new(c) for c in board.split()])
+
+
+@pytest.mark.parametrize('hand, board, text', baseline_cases)
+def test_describe_hand_matches_baseline(hand, board, text):
+    assert describe_hand(rank_of(hand, board))['text'] == text
+    assert pretty_print_hand([Card.new(c) for c in hand.split()], None, [Card.new(c) for c in board.split()]) == text
+
+
+def test_full_house_names_the_pair():
+    # The original pretty_print_hand counted the trips as a pair too, printing 'Queens full of Queens'
+    description = describe_hand(rank_of('Qc Qd', 'Qh Ts Td 2c 3s'))
+    assert description['text'] == 'a full house, Queens full of Tens'
+    assert description['ranks'] == [10, 8]
+
+
+def test_describe_hand_ranks_and_kickers():
+    assert describe_hand(rank_of('Kh Kd', 'Qs Qh 5c 5d 2s')) == {
+        'category': 'Two Pair', 'ranks': [11, 10], 'kickers': [3], 'text': 'two pair, Kings and Queens'
+    }
+    assert describe_hand(rank_of('Jc 3d', 'Jh 8s 6d 4c 2s'))['kickers'] == [6, 4, 2]
+    assert describe_hand(rank_of('Ah 2c', '3d 4s 5h 9c Kd'))['ranks'] == [3, 0]
+
+
+def test_describe_hand_is_cached():
+    rank = rank_of('7c 7d', '7h 7s Kd 2c 3c')
+    assert describe_hand(rank) is describe_hand(rank)
+
+
+def test_royal_flush_category(monkeypatch):
+    # Newer treys versions name the best straight flush 'Royal Flush'
+    evaluator = utils._get_evaluator()
+    monkeypatch.setattr(utils, 'hand_descriptions', {})
+    monkeypatch.setattr(evaluator, 'class_to_string', lambda rank_class: 'Royal Flush')
+    description = utils.describe_hand(rank_of('As Ks', 'Qs Js Ts 2c 3d'))
+    assert description['category'] == 'Royal Flush'
+    assert description['text'] == 'royal flush, Ten to Ace'
+
+
+def test_unknown_category_raises(monkeypatch):
+    evaluator = utils._get_evaluator()
+    monkeypatch.setattr(utils, 'hand_descriptions', {})
+    monkeypatch.setattr(evaluator, 'class_to_string', lambda rank_class: 'Five of a Kind')
+    with pytest.raises(Exception, match='Unknown hand category'):
+        utils.describe_hand(1)